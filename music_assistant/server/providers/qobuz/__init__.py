@@ -2,8 +2,9 @@
 
 from __future__ import annotations
 
-import datetime
+import asyncio
 import hashlib
+import ssl
 import time
 from json import JSONDecodeError
 from typing import TYPE_CHECKING
@@ -11,6 +12,7 @@ from typing import TYPE_CHECKING
 import aiohttp
 from asyncio_throttle import Throttler
 
+from music_assistant.common.helpers.json import json_dumps, json_loads
 from music_assistant.common.helpers.util import parse_title_and_version, try_parse_int
 from music_assistant.common.models.config_entries import ConfigEntry, ConfigValueType
 from music_assistant.common.models.enums import ConfigEntryType, ExternalID, ProviderFeature
@@ -71,6 +73,18 @@ SUPPORTED_FEATURES = (
 )
 
 VARIOUS_ARTISTS_ID = "145383"
+BASE_URL = "https://www.qobuz.com/api.json/0.2"
+AUTH_CACHE_EXPIRATION = 86400 * 7
+PAGE_SIZE = 200
+IMAGE_KEYS = ("extralarge", "large", "medium", "small")
+# qobuz returns this (placeholder) image for items without artwork
+PLACEHOLDER_IMAGE_ID = "2a96cbd8b46e442fc41c2b86b821562f"
+SEARCH_TYPE_MAP = {
+    MediaType.ARTIST: "artists",
+    MediaType.ALBUM: "albums",
+    MediaType.TRACK: "tracks",
+    MediaType.PLAYLIST: "playlists",
+}
 
 
 async def setup(
@@ -117,10 +131,25 @@ class QobuzProvider(MusicProvider):
 
     _user_auth_info: str | None = None
     _throttler: Throttler
+    _semaphore: asyncio.Semaphore
+    _auth_lock: asyncio.Lock
+    _ssl_context: ssl.SSLContext
+    _app_id: str
+    _app_secret: str
+    _playback_events: list[dict]
 
     async def handle_async_init(self) -> None:
         """Handle async initialization of the provider."""
         self._throttler = Throttler(rate_limit=4, period=1)
+        # limit the number of requests in flight (e.g. when fetching pages concurrently)
+        self._semaphore = asyncio.Semaphore(8)
+        self._auth_lock = asyncio.Lock()
+        # a single (verifying) ssl context allows tls sessions to be reused
+        # creating it loads the system certificates, so do that in the executor
+        self._ssl_context = await asyncio.to_thread(ssl.create_default_context)
+        self._app_id = app_var(0)
+        self._app_secret = app_var(1)
+        self._playback_events = []
 
         if not self.config.get_value(CONF_USERNAME) or not self.config.get_value(CONF_PASSWORD):
             msg = "Invalid login credentials"
@@ -147,20 +176,13 @@ class QobuzProvider(MusicProvider):
         """
         result = SearchResults()
         params = {"query": search_query, "limit": limit}
-        if len(media_types) == 1:
-            # qobuz does not support multiple searchtypes, falls back to all if no type given
-            if media_types[0] == MediaType.ARTIST:
-                params["type"] = "artists"
-            if media_types[0] == MediaType.ALBUM:
-                params["type"] = "albums"
-            if media_types[0] == MediaType.TRACK:
-                params["type"] = "tracks"
-            if media_types[0] == MediaType.PLAYLIST:
-                params["type"] = "playlists"
+        # qobuz does not support multiple searchtypes, falls back to all if no type given
+        if len(media_types) == 1 and (search_type := SEARCH_TYPE_MAP.get(media_types[0])):
+            params["type"] = search_type
         if searchresult := await self._get_data("catalog/search", **params):
             if "artists" in searchresult:
                 result.artists += [
-                    await self._parse_artist(item)
+                    self._parse_artist(item)
                     for item in searchresult["artists"]["items"]
                     if (item and item["id"])
                 ]
@@ -178,7 +200,7 @@ class QobuzProvider(MusicProvider):
                 ]
             if "playlists" in searchresult:
                 result.playlists += [
-                    await self._parse_playlist(item)
+                    self._parse_playlist(item)
                     for item in searchresult["playlists"]["items"]
                     if (item and item["id"])
                 ]
@@ -189,7 +211,7 @@ class QobuzProvider(MusicProvider):
         endpoint = "favorite/getUserFavorites"
         for item in await self._get_all_items(endpoint, key="artists", type="artists"):
             if item and item["id"]:
-                yield await self._parse_artist(item)
+                yield self._parse_artist(item)
 
     async def get_library_albums(self) -> AsyncGenerator[Album, None]:
         """Retrieve all library albums from Qobuz."""
@@ -210,13 +232,13 @@ class QobuzProvider(MusicProvider):
         endpoint = "playlist/getUserPlaylists"
         for item in await self._get_all_items(endpoint, key="playlists"):
             if item and item["id"]:
-                yield await self._parse_playlist(item)
+                yield self._parse_playlist(item)
 
     async def get_artist(self, prov_artist_id) -> Artist:
         """Get full artist details by id."""
         params = {"artist_id": prov_artist_id}
         if (artist_obj := await self._get_data("artist/get", **params)) and artist_obj["id"]:
-            return await self._parse_artist(artist_obj)
+            return self._parse_artist(artist_obj)
         msg = f"Item {prov_artist_id} not found"
         raise MediaNotFoundError(msg)
 
@@ -240,7 +262,7 @@ class QobuzProvider(MusicProvider):
         """Get full playlist details by id."""
         params = {"playlist_id": prov_playlist_id}
         if (playlist_obj := await self._get_data("playlist/get", **params)) and playlist_obj["id"]:
-            return await self._parse_playlist(playlist_obj)
+            return self._parse_playlist(playlist_obj)
         msg = f"Item {prov_playlist_id} not found"
         raise MediaNotFoundError(msg)
 
@@ -362,12 +384,22 @@ class QobuzProvider(MusicProvider):
         self, prov_playlist_id: str, positions_to_remove: tuple[int]
     ) -> None:
         """Remove track(s) from playlist."""
+        positions = set(positions_to_remove)
         playlist_track_ids = set()
-        async for track in self.get_playlist_tracks(prov_playlist_id):
-            if track.position in positions_to_remove:
-                playlist_track_ids.add(str(track["playlist_track_id"]))
-            if len(playlist_track_ids) == positions_to_remove:
-                break
+        count = 1
+        for track_obj in await self._get_all_items(
+            "playlist/get",
+            key="tracks",
+            playlist_id=prov_playlist_id,
+            extra="tracks",
+        ):
+            if not (track_obj and track_obj["id"]):
+                continue
+            if count in positions:
+                playlist_track_ids.add(str(track_obj["playlist_track_id"]))
+                if len(playlist_track_ids) == len(positions):
+                    break
+            count += 1
         return await self._get_data(
             "playlist/deleteTracks",
             playlist_id=prov_playlist_id,
@@ -377,20 +409,37 @@ class QobuzProvider(MusicProvider):
     async def get_stream_details(self, item_id: str) -> StreamDetails:
         """Return the content details for the given track when it will be streamed."""
         streamdata = None
-        for format_id in [27, 7, 6, 5]:
-            # it seems that simply requesting for highest available quality does not work
-            # from time to time the api response is empty for this request ?!
-            result = await self._get_data(
-                "track/getFileUrl",
-                sign_request=True,
-                format_id=format_id,
-                track_id=item_id,
-                intent="stream",
-            )
+        # it seems that simply requesting for highest available quality does not work
+        # from time to time the api response is empty for this request ?!
+        # request all formats at once and pick the highest quality that succeeded
+        format_ids = (27, 7, 6, 5)
+        results = await asyncio.gather(
+            *(
+                self._get_data(
+                    "track/getFileUrl",
+                    sign_request=True,
+                    format_id=format_id,
+                    track_id=item_id,
+                    intent="stream",
+                )
+                for format_id in format_ids
+            ),
+            return_exceptions=True,
+        )
+        first_error: BaseException | None = None
+        for format_id, result in zip(format_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                self.logger.debug(
+                    "Retrieving format %s for %s failed: %s", format_id, item_id, str(result)
+                )
+                first_error = first_error or result
+                continue
             if result and result.get("url"):
                 streamdata = result
                 break
         if not streamdata:
+            if first_error:
+                raise first_error
             msg = f"Unable to retrieve stream details for {item_id}"
             raise MediaNotFoundError(msg)
         if streamdata["mime_type"] == "audio/mpeg":
@@ -401,7 +450,7 @@ class QobuzProvider(MusicProvider):
             msg = f"Unsupported mime type for {item_id}"
             raise MediaNotFoundError(msg)
         # report playback started as soon as the streamdetails are requested
-        self.mass.create_task(self._report_playback_started(streamdata))
+        self._report_playback_started(streamdata)
         return StreamDetails(
             item_id=str(item_id),
             provider=self.instance_id,
@@ -416,32 +465,50 @@ class QobuzProvider(MusicProvider):
             direct=streamdata["url"],
         )
 
-    async def _report_playback_started(self, streamdata: dict) -> None:
+    def _report_playback_started(self, streamdata: dict) -> None:
         """Report playback start to qobuz."""
+        # only collect the (known) track details here, the full event is built
+        # when the events are sent so that nothing can fail in the playback path
+        self._playback_events.append(
+            {
+                "track_id": streamdata.get("track_id"),
+                "format_id": streamdata.get("format_id"),
+                "date": int(time.time()),
+            }
+        )
+        if len(self._playback_events) == 1:
+            # coalesce events of (quickly) skipped tracks into a single report
+            self.mass.call_later(0.5, self._send_playback_events)
+
+    async def _send_playback_events(self) -> None:
+        """Send the collected playback start events to qobuz."""
         # TODO: need to figure out if the streamed track is purchased by user
         # https://www.qobuz.com/api.json/0.2/purchase/getUserPurchasesIds?limit=5000&user_id=xxxxxxx
         # {"albums":{"total":0,"items":[]},
         # "tracks":{"total":0,"items":[]},"user":{"id":xxxx,"login":"xxxxx"}}
-        device_id = self._user_auth_info["user"]["device"]["id"]
-        credential_id = self._user_auth_info["user"]["credential"]["id"]
-        user_id = self._user_auth_info["user"]["id"]
-        format_id = streamdata["format_id"]
-        timestamp = int(time.time())
-        events = [
-            {
-                "online": True,
-                "sample": False,
-                "intent": "stream",
-                "device_id": device_id,
-                "track_id": streamdata["track_id"],
-                "purchase": False,
-                "date": timestamp,
-                "credential_id": credential_id,
-                "user_id": user_id,
-                "local": False,
-                "format_id": format_id,
-            }
-        ]
+        events, self._playback_events = self._playback_events, []
+        if not events:
+            return
+        try:
+            device_id = self._user_auth_info["user"]["device"]["id"]
+            credential_id = self._user_auth_info["user"]["credential"]["id"]
+            user_id = self._user_auth_info["user"]["id"]
+        except (KeyError, TypeError) as err:
+            self.logger.warning("Unable to report playback to Qobuz: %s", str(err))
+            return
+        for event in events:
+            event.update(
+                {
+                    "online": True,
+                    "sample": False,
+                    "intent": "stream",
+                    "device_id": device_id,
+                    "purchase": False,
+                    "credential_id": credential_id,
+                    "user_id": user_id,
+                    "local": False,
+                }
+            )
         await self._post_data("track/reportStreamingStart", data=events)
 
     async def on_streamed(self, streamdetails: StreamDetails, seconds_streamed: int) -> None:
@@ -454,7 +521,7 @@ class QobuzProvider(MusicProvider):
             duration=try_parse_int(seconds_streamed),
         )
 
-    async def _parse_artist(self, artist_obj: dict):
+    def _parse_artist(self, artist_obj: dict):
         """Parse qobuz artist object to generic layout."""
         artist = Artist(
             item_id=str(artist_obj["id"]),
@@ -483,15 +550,16 @@ class QobuzProvider(MusicProvider):
         if not artist_obj and "artist" not in album_obj:
             # artist missing in album info, return full abum instead
             return await self.get_album(album_obj["id"])
+        item_id = str(album_obj["id"])
         name, version = parse_title_and_version(album_obj["title"], album_obj.get("version"))
         album = Album(
-            item_id=str(album_obj["id"]),
+            item_id=item_id,
             provider=self.domain,
             name=name,
             version=version,
             provider_mappings={
                 ProviderMapping(
-                    item_id=str(album_obj["id"]),
+                    item_id=item_id,
                     provider_domain=self.domain,
                     provider_instance=self.instance_id,
                     available=album_obj["streamable"] and album_obj["displayable"],
@@ -500,38 +568,32 @@ class QobuzProvider(MusicProvider):
                         sample_rate=album_obj["maximum_sampling_rate"] * 1000,
                         bit_depth=album_obj["maximum_bit_depth"],
                     ),
-                    url=f'https://open.qobuz.com/album/{album_obj["id"]}',
+                    url=f"https://open.qobuz.com/album/{item_id}",
                 )
             },
         )
         album.external_ids.add((ExternalID.BARCODE, album_obj["upc"]))
-        album.artists.append(await self._parse_artist(artist_obj or album_obj["artist"]))
-        if (
-            album_obj.get("product_type", "") == "single"
-            or album_obj.get("release_type", "") == "single"
-        ):
+        album.artists.append(self._parse_artist(artist_obj or album_obj["artist"]))
+        product_type = album_obj.get("product_type", "")
+        release_type = album_obj.get("release_type", "")
+        if "single" in (product_type, release_type):
             album.album_type = AlbumType.SINGLE
-        elif (
-            album_obj.get("product_type", "") == "compilation" or "Various" in album.artists[0].name
-        ):
+        elif product_type == "compilation" or "Various" in album.artists[0].name:
             album.album_type = AlbumType.COMPILATION
-        elif (
-            album_obj.get("product_type", "") == "album"
-            or album_obj.get("release_type", "") == "album"
-        ):
+        elif "album" in (product_type, release_type):
             album.album_type = AlbumType.ALBUM
-        if "genre" in album_obj:
-            album.metadata.genres = {album_obj["genre"]["name"]}
+        if genre := album_obj.get("genre"):
+            album.metadata.genres = {genre["name"]}
         if img := self.__get_image(album_obj):
             album.metadata.images = [MediaItemImage(type=ImageType.THUMB, path=img)]
-        if "label" in album_obj:
-            album.metadata.label = album_obj["label"]["name"]
-        if (released_at := album_obj.get("released_at")) and released_at != 0:
-            album.year = datetime.datetime.fromtimestamp(album_obj["released_at"]).year
-        if album_obj.get("copyright"):
-            album.metadata.copyright = album_obj["copyright"]
-        if album_obj.get("description"):
-            album.metadata.description = album_obj["description"]
+        if label := album_obj.get("label"):
+            album.metadata.label = label["name"]
+        if released_at := album_obj.get("released_at"):
+            album.year = time.gmtime(released_at).tm_year
+        if copyright_str := album_obj.get("copyright"):
+            album.metadata.copyright = copyright_str
+        if description := album_obj.get("description"):
+            album.metadata.description = description
         if album_obj.get("parental_warning"):
             album.metadata.explicit = True
         return album
@@ -552,15 +614,16 @@ class QobuzProvider(MusicProvider):
         else:
             track_class = Track
             extra_init_kwargs = {}
+        item_id = str(track_obj["id"])
         track = track_class(
-            item_id=str(track_obj["id"]),
+            item_id=item_id,
             provider=self.domain,
             name=name,
             version=version,
             duration=track_obj["duration"],
             provider_mappings={
                 ProviderMapping(
-                    item_id=str(track_obj["id"]),
+                    item_id=item_id,
                     provider_domain=self.domain,
                     provider_instance=self.instance_id,
                     available=track_obj["streamable"] and track_obj["displayable"],
@@ -569,24 +632,26 @@ class QobuzProvider(MusicProvider):
                         sample_rate=track_obj["maximum_sampling_rate"] * 1000,
                         bit_depth=track_obj["maximum_bit_depth"],
                     ),
-                    url=f'https://open.qobuz.com/track/{track_obj["id"]}',
+                    url=f"https://open.qobuz.com/track/{item_id}",
                 )
             },
             **extra_init_kwargs,
         )
         if isrc := track_obj.get("isrc"):
             track.external_ids.add((ExternalID.ISRC, isrc))
-        if track_obj.get("performer") and "Various " not in track_obj["performer"]:
-            artist = await self._parse_artist(track_obj["performer"])
+        album_obj = track_obj.get("album")
+        if (performer := track_obj.get("performer")) and "Various " not in performer:
+            artist = self._parse_artist(performer)
             if artist:
                 track.artists.append(artist)
         # try to grab artist from album
-        if not track.artists and (
-            track_obj.get("album")
-            and track_obj["album"].get("artist")
-            and "Various " not in track_obj["album"]["artist"]
+        if (
+            not track.artists
+            and album_obj
+            and (album_artist := album_obj.get("artist"))
+            and "Various " not in album_artist
         ):
-            artist = await self._parse_artist(track_obj["album"]["artist"])
+            artist = self._parse_artist(album_artist)
             if artist:
                 track.artists.append(artist)
         if not track.artists:
@@ -611,13 +676,13 @@ class QobuzProvider(MusicProvider):
         # TODO: fix grabbing composer from details
 
         if "album" in track_obj:
-            album = await self._parse_album(track_obj["album"])
+            album = await self._parse_album(album_obj)
             if album:
                 track.album = album
-        if track_obj.get("performers"):
-            track.metadata.performers = {x.strip() for x in track_obj["performers"].split("-")}
-        if track_obj.get("copyright"):
-            track.metadata.copyright = track_obj["copyright"]
+        if performers := track_obj.get("performers"):
+            track.metadata.performers = {x.strip() for x in performers.split("-")}
+        if copyright_str := track_obj.get("copyright"):
+            track.metadata.copyright = copyright_str
         if track_obj.get("parental_warning"):
             track.metadata.explicit = True
         if img := self.__get_image(track_obj):
@@ -625,7 +690,7 @@ class QobuzProvider(MusicProvider):
 
         return track
 
-    async def _parse_playlist(self, playlist_obj):
+    def _parse_playlist(self, playlist_obj):
         """Parse qobuz playlist object to generic layout."""
         playlist = Playlist(
             item_id=str(playlist_obj["id"]),
@@ -654,46 +719,102 @@ class QobuzProvider(MusicProvider):
         """Login to qobuz and store the token."""
         if self._user_auth_info:
             return self._user_auth_info["user_auth_token"]
-        params = {
-            "username": self.config.get_value(CONF_USERNAME),
-            "password": self.config.get_value(CONF_PASSWORD),
-            "device_manufacturer_id": "music_assistant",
-        }
-        details = await self._get_data("user/login", **params)
-        if details and "user" in details:
+        async with self._auth_lock:
+            if self._user_auth_info:
+                # another request logged in while we were waiting
+                return self._user_auth_info["user_auth_token"]
+            username = self.config.get_value(CONF_USERNAME)
+            cache_key = f"{self.instance_id}.auth_info"
+            # try to reuse the auth info of a previous session,
+            # a revoked/expired token is detected (and refreshed) when the api rejects it
+            details = await self.mass.cache.get(cache_key, checksum=username)
+            if details and "user" in details:
+                self.logger.debug("Using cached Qobuz login for %s", username)
+            else:
+                params = {
+                    "username": username,
+                    "password": self.config.get_value(CONF_PASSWORD),
+                    "device_manufacturer_id": "music_assistant",
+                }
+                details = await self._get_data("user/login", **params)
+                if not (details and "user" in details):
+                    return None
+                self.logger.info(
+                    "Successfully logged in to Qobuz as %s", details["user"]["display_name"]
+                )
+                await self.mass.cache.set(
+                    cache_key, details, checksum=username, expiration=AUTH_CACHE_EXPIRATION
+                )
             self._user_auth_info = details
-            self.logger.info(
-                "Successfully logged in to Qobuz as %s", details["user"]["display_name"]
-            )
             self.mass.metadata.preferred_language = details["user"]["country_code"]
             return details["user_auth_token"]
-        return None
+
+    async def _invalidate_auth_token(self, auth_token: str) -> None:
+        """Forget the (cached) auth info after the api rejected the given token."""
+        if self._user_auth_info and self._user_auth_info["user_auth_token"] == auth_token:
+            self.logger.debug("Qobuz auth token is no longer valid, logging in again")
+            self._user_auth_info = None
+            await self.mass.cache.delete(f"{self.instance_id}.auth_info")
 
     async def _get_all_items(self, endpoint, key="tracks", **kwargs):
         """Get all items from a paged list."""
-        limit = 50
-        offset = 0
-        all_items = []
+        limit = PAGE_SIZE
+        # the first page tells us the total number of items,
+        # so all other pages can be requested at once (the throttler guards the rate limit)
+        result = await self._get_data(endpoint, **kwargs, limit=limit, offset=0)
+        if not result or not result.get(key) or not result[key].get("items"):
+            return []
+        first_page = result[key]["items"]
+        if len(first_page) < limit:
+            return list(first_page)
+        if (total_items := result[key].get("total")) is None:
+            self.logger.debug("No total returned for %s, fetching pages one by one", endpoint)
+            return await self._get_remaining_items(endpoint, key, list(first_page), **kwargs)
+        all_items = list(first_page)
+        pages = await asyncio.gather(
+            *(
+                self._get_data(endpoint, **kwargs, limit=limit, offset=offset)
+                for offset in range(limit, total_items, limit)
+            )
+        )
+        for page in pages:
+            if page and page.get(key) and page[key].get("items"):
+                all_items.extend(page[key]["items"])
+        if len(all_items) < total_items:
+            # a page failed or came back short, fall back to fetching the pages one by one
+            self.logger.debug(
+                "Received %s of %s items for %s, fetching pages one by one",
+                len(all_items),
+                total_items,
+                endpoint,
+            )
+            return await self._get_remaining_items(endpoint, key, list(first_page), **kwargs)
+        if len(all_items) % limit == 0:
+            # the last page was full, the total may be under-reported
+            return await self._get_remaining_items(endpoint, key, all_items, **kwargs)
+        return all_items
+
+    async def _get_remaining_items(self, endpoint, key, items, **kwargs):
+        """Fetch the pages after the given (full pages of) items until a short page is returned."""
+        limit = PAGE_SIZE
+        offset = len(items)
         while True:
-            kwargs["limit"] = limit
-            kwargs["offset"] = offset
-            result = await self._get_data(endpoint, **kwargs)
-            offset += limit
-            if not result:
-                break
-            if not result.get(key) or not result[key].get("items"):
+            result = await self._get_data(endpoint, **kwargs, limit=limit, offset=offset)
+            if not result or not result.get(key) or not result[key].get("items"):
                 break
-            for item in result[key]["items"]:
-                all_items.append(item)
+            items.extend(result[key]["items"])
             if len(result[key]["items"]) < limit:
                 break
-        return all_items
+            offset += limit
+        return items
 
-    async def _get_data(self, endpoint, sign_request=False, **kwargs):
+    async def _get_data(self, endpoint, sign_request=False, retry_auth=True, **kwargs):
         """Get data from api."""
         # pylint: disable=too-many-branches
-        url = f"http://www.qobuz.com/api.json/0.2/{endpoint}"
-        headers = {"X-App-Id": app_var(0)}
+        url = f"{BASE_URL}/{endpoint}"
+        headers = {"X-App-Id": self._app_id}
+        params = kwargs
+        auth_token = None
         if endpoint != "user/login":
             auth_token = await self._auth_token()
             if not auth_token:
@@ -701,83 +822,98 @@ class QobuzProvider(MusicProvider):
                 return None
             headers["X-User-Auth-Token"] = auth_token
         if sign_request:
-            signing_data = "".join(endpoint.split("/"))
-            keys = list(kwargs.keys())
-            keys.sort()
-            for key in keys:
-                signing_data += f"{key}{kwargs[key]}"
             request_ts = str(time.time())
-            request_sig = signing_data + request_ts + app_var(1)
-            request_sig = str(hashlib.md5(request_sig.encode()).hexdigest())
-            kwargs["request_ts"] = request_ts
-            kwargs["request_sig"] = request_sig
-            kwargs["app_id"] = app_var(0)
-            kwargs["user_auth_token"] = await self._auth_token()
+            signing_data = [endpoint.replace("/", "")]
+            signing_data.extend(f"{key}{value}" for key, value in sorted(kwargs.items()))
+            signing_data.append(request_ts)
+            signing_data.append(self._app_secret)
+            request_sig = hashlib.md5("".join(signing_data).encode()).hexdigest()
+            params = {
+                **kwargs,
+                "request_ts": request_ts,
+                "request_sig": request_sig,
+                "app_id": self._app_id,
+                "user_auth_token": auth_token,
+            }
         async with (
+            self._semaphore,
             self._throttler,
-            self.mass.http_session.get(url, headers=headers, params=kwargs, ssl=False) as response,
+            self.mass.http_session.get(
+                url, headers=headers, params=params, ssl=self._ssl_context
+            ) as response,
         ):
-            try:
-                result = await response.json()
-                # check for error in json
-                if error := result.get("error"):
-                    raise ValueError(error)
-                if result.get("status") and "error" in result["status"]:
-                    raise ValueError(result["status"])
-            except (
-                aiohttp.ContentTypeError,
-                JSONDecodeError,
-                AssertionError,
-                ValueError,
-            ) as err:
-                text = await response.text()
-                self.logger.exception("Error while processing %s: %s", endpoint, text, exc_info=err)
-                return None
-            return result
+            if not (response.status == 401 and auth_token and retry_auth):
+                try:
+                    result = await response.json(loads=json_loads)
+                    # check for error in json
+                    if error := result.get("error"):
+                        raise ValueError(error)
+                    if result.get("status") and "error" in result["status"]:
+                        raise ValueError(result["status"])
+                except (
+                    aiohttp.ContentTypeError,
+                    JSONDecodeError,
+                    AssertionError,
+                    ValueError,
+                ) as err:
+                    text = await response.text()
+                    self.logger.exception(
+                        "Error while processing %s: %s", endpoint, text, exc_info=err
+                    )
+                    return None
+                return result
+        # the (cached) auth token got rejected, login again and retry (once)
+        await self._invalidate_auth_token(auth_token)
+        return await self._get_data(endpoint, sign_request=sign_request, retry_auth=False, **kwargs)
 
-    async def _post_data(self, endpoint, params=None, data=None):
+    async def _post_data(self, endpoint, params=None, data=None, retry_auth=True):
         """Post data to api."""
-        if not params:
-            params = {}
         if not data:
             data = {}
-        url = f"http://www.qobuz.com/api.json/0.2/{endpoint}"
-        params["app_id"] = app_var(0)
-        params["user_auth_token"] = await self._auth_token()
+        url = f"{BASE_URL}/{endpoint}"
+        auth_token = await self._auth_token()
+        request_params = {**(params or {}), "app_id": self._app_id, "user_auth_token": auth_token}
+        headers = {"Content-Type": "application/json"}
         async with self.mass.http_session.post(
-            url, params=params, json=data, ssl=False
+            url,
+            params=request_params,
+            data=json_dumps(data),
+            headers=headers,
+            ssl=self._ssl_context,
         ) as response:
-            try:
-                result = await response.json()
-                # check for error in json
-                if error := result.get("error"):
-                    raise ValueError(error)
-                if result.get("status") and "error" in result["status"]:
-                    raise ValueError(result["status"])
-            except (
-                aiohttp.ContentTypeError,
-                JSONDecodeError,
-                AssertionError,
-                ValueError,
-            ):
-                text = await response.text()
-                self.logger.error("Error while processing %s: %s", endpoint, text)
-                return None
-            return result
+            if not (response.status == 401 and auth_token and retry_auth):
+                try:
+                    result = await response.json(loads=json_loads)
+                    # check for error in json
+                    if error := result.get("error"):
+                        raise ValueError(error)
+                    if result.get("status") and "error" in result["status"]:
+                        raise ValueError(result["status"])
+                except (
+                    aiohttp.ContentTypeError,
+                    JSONDecodeError,
+                    AssertionError,
+                    ValueError,
+                ):
+                    text = await response.text()
+                    self.logger.error("Error while processing %s: %s", endpoint, text)
+                    return None
+                return result
+        # the (cached) auth token got rejected, login again and retry (once)
+        await self._invalidate_auth_token(auth_token)
+        return await self._post_data(endpoint, params=params, data=data, retry_auth=False)
 
     def __get_image(self, obj: dict) -> str | None:
         """Try to parse image from Qobuz media object."""
-        if obj.get("image"):
-            for key in ["extralarge", "large", "medium", "small"]:
-                if obj["image"].get(key):
-                    if "2a96cbd8b46e442fc41c2b86b821562f" in obj["image"][key]:
-                        continue
-                    return obj["image"][key]
-        if obj.get("images300"):
+        if image := obj.get("image"):
+            for key in IMAGE_KEYS:
+                if (url := image.get(key)) and PLACEHOLDER_IMAGE_ID not in url:
+                    return url
+        if images300 := obj.get("images300"):
             # playlists seem to use this strange format
-            return obj["images300"][0]
-        if obj.get("album"):
-            return self.__get_image(obj["album"])
-        if obj.get("artist"):
-            return self.__get_image(obj["artist"])
+            return images300[0]
+        if album_obj := obj.get("album"):
+            return self.__get_image(album_obj)
+        if artist_obj := obj.get("artist"):
+            return self.__get_image(artist_obj)
         return None
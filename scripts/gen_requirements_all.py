@@ -2,17 +2,19 @@
 
 from __future__ import annotations
 
-import json
 import os
 import re
 import sys
 import tomllib
 from pathlib import Path
 
+import orjson
+
 PACKAGE_REGEX = re.compile(r"^(?:--.+\s)?([-_\.\w\d]+).*==.+$")
 GIT_REPO_REGEX = re.compile(r"^(git\+https:\/\/[-_\.\w\d\/]+[@-_\.\w\d\/]*)$")
+PACKAGE_NAME_TRANSLATION = str.maketrans("_", "-")
 
-# ruff: noqa: PTH112,PTH113,PTH118,PTH123,T201
+# ruff: noqa: PTH113,PTH123,T201
 
 
 def gather_core_requirements() -> list[str]:
@@ -29,22 +31,10 @@ def gather_core_requirements() -> list[str]:
 def gather_requirements_from_manifests() -> list[str]:
     """Gather all of the requirements from provider manifests."""
     dependencies: list[str] = []
-    providers_path = "music_assistant/server/providers"
-    for dir_str in os.listdir(providers_path):
-        dir_path = os.path.join(providers_path, dir_str)
-        if not os.path.isdir(dir_path):
-            continue
-        # get files in subdirectory
-        for file_str in os.listdir(dir_path):
-            file_path = os.path.join(dir_path, file_str)
-            if not os.path.isfile(file_path):
-                continue
-            if file_str != "manifest.json":
-                continue
-
-            with open(file_path) as _file:
-                provider_manifest = json.loads(_file.read())
-                dependencies += provider_manifest["requirements"]
+    providers_path = Path("music_assistant/server/providers")
+    for manifest_path in providers_path.glob("*/manifest.json"):
+        provider_manifest = orjson.loads(manifest_path.read_bytes())
+        dependencies += provider_manifest["requirements"]
     return dependencies
 
 
@@ -62,9 +52,9 @@ def main() -> int:
     final_requirements: dict[str, str] = {}
     for req_str in core_reqs + extra_reqs:
         package_name = req_str
-        if match := PACKAGE_REGEX.search(req_str):
-            package_name = match.group(1).lower().replace("_", "-")
-        elif match := GIT_REPO_REGEX.search(req_str):
+        if match := PACKAGE_REGEX.match(req_str):
+            package_name = match.group(1).translate(PACKAGE_NAME_TRANSLATION).lower()
+        elif match := GIT_REPO_REGEX.match(req_str):
             package_name = match.group(1)
         elif package_name in final_requirements:
             # duplicate package without version is safe to ignore
@@ -79,11 +69,9 @@ def main() -> int:
             continue
         final_requirements[package_name] = req_str
 
-    content = "# WARNING: this file is autogenerated!\n\n"
-    for req_key in sorted(final_requirements):
-        req_str = final_requirements[req_key]
-        content += f"{req_str}\n"
-    Path("requirements_all.txt").write_text(content)
+    lines = ["# WARNING: this file is autogenerated!\n\n"]
+    lines.extend(f"{final_requirements[req_key]}\n" for req_key in sorted(final_requirements))
+    Path("requirements_all.txt").write_bytes("".join(lines).encode())
 
     return 0
 